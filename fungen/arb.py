@@ -2,29 +2,59 @@
 
 from __future__ import division
 import numpy as np
-from functools import partial
 
 
 class Waveform(object):
     """Base arbitrary waveform class.
 
-    :param list data: A list of points to convert to a waveform in units of
-        volts.
+    :param array_like data: A sequence of points to convert to a waveform in
+        units of volts.
     :param float sample_rate: Rate in Hz of waveform.
+    :param bool copy: When False, a float64 ``data`` array is normalized in
+        place instead of being copied (default: ``True``).
 
     """
-    def __init__(self, data, sample_rate):
-        data = np.array(data)
-        assert len(data.shape) == 1
+    def __init__(self, data, sample_rate, copy=True):
+        # Avoid copying input which is already a float64 array
+        data = np.asarray(data, dtype=np.float64)
+        assert data.ndim == 1
 
         self.sample_rate = sample_rate
-        self.amplitude = max(abs(data))
-        self.data = data / self.amplitude
+        # Peak magnitude of a real-valued waveform via two NumPy reductions
+        self.amplitude = float(max(-data.min(), data.max()))
+        if not 0 < self.amplitude < np.inf:
+            raise ValueError("Waveform data must be finite and not all zero")
+        if copy:
+            self.data = data / self.amplitude
+        else:
+            self.data = np.divide(data, self.amplitude, out=data)
+
+        # Encoded samples are cached so that repeated uploads don't pay for
+        # the conversion again. The ASCII form is only built when needed.
+        # DAC codes are rounded straight into a big-endian int16 buffer
+        # rather than truncated toward zero by astype.
+        codes = np.empty(self.data.shape, dtype=">i2")
+        np.rint(self.data * 32767, out=codes, casting="unsafe")
+        self._dac_payload = codes.tobytes()
+        self._ascii_payload = None
+
+    def _get_ascii_payload(self):
+        """Return the samples as comma-separated ASCII bytes."""
+        if self._ascii_payload is None:
+            # 7 significant digits is already finer than the DAC resolution.
+            # A single bytes format call writes every sample directly into
+            # the output buffer without creating an object per formatted
+            # sample, and the template is built by repetition rather than
+            # joining a list.
+            template = b"%.7g," * (len(self.data) - 1) + b"%.7g"
+            self._ascii_payload = template % tuple(self.data.tolist())
+        return self._ascii_payload
 
     def write_file(self, filename):
         """Override to write to a file in the appropriate format."""
 
-    def write_to_device(self, dev, name="func", toggle_output=True, echo=False):
+    def write_to_device(self, dev, name="func", toggle_output=True, echo=False,
+                        binary=True):
         """Override to write to the VISA device.
 
         :param FunctionGenerator dev:
@@ -32,20 +62,49 @@ class Waveform(object):
         :param bool toggle_output: When True, first turn the output off before
             making changes, then turn it back on when complete. If False, the
             output state won't be changed.
+        :param bool binary: When True (the default), upload the waveform as
+            16-bit DAC codes in a binary block. Set to False to fall back to
+            the (much slower) ASCII transfer for firmware which doesn't
+            support ``DATA:ARB:DAC``.
 
         """
-        write = partial(dev.write, echo=echo)
+        # Commands are batched into as few VISA transactions as possible
+        setup, commands = [], []
 
         if toggle_output:
-            write("OUTPUT%s OFF" %(dev.channel))
+            setup.append(f"{dev._output} OFF")
 
-        write("SOURCE%s:data:arb %s, %s" % (dev.channel, name, ",".join([str(x) for x in self.data])))
-        write("SOURCE%s:func:arb %s" % (dev.channel, name))
-        write("SOURCE%s:func:arb:srate %s" % (dev.channel, str(self.sample_rate)))
-        write("SOURCE%s:voltage:amplitude %s V" % (dev.channel, str(self.amplitude)))
+        commands.append(f"{dev._source}:func:arb {name}")
+        commands.append(f"{dev._source}:func:arb:srate {self.sample_rate}")
+        commands.append(f"{dev._source}:voltage:amplitude {self.amplitude} V")
 
         if toggle_output:
-            write("OUTPUT%s ON" %(dev.channel))
+            commands.append(f"{dev._output} ON")
+
+        if binary:
+            # DAC codes span -32767 to +32767 and are sent MSB first
+            setup.append("FORMAT:BORDER NORMAL")
+            setup.append(f"{dev._source}:data:arb:dac {name}, ")
+            # Wrap the cached bytes in an IEEE 488.2 definite-length block
+            length = str(len(self._dac_payload))
+            message = b"".join([
+                ";:".join(setup).encode("ascii"),
+                f"#{len(length)}{length}".encode("ascii"),
+                self._dac_payload,
+                dev.device.write_termination.encode("ascii"),
+            ])
+            dev.write_raw(message, echo=echo)
+            dev.write_many(commands, echo=echo)
+        else:
+            # Send the cached bytes as-is rather than re-encoding a str
+            setup.append(f"{dev._source}:data:arb {name}, ")
+            message = b"".join([
+                ";:".join(setup).encode("ascii"),
+                self._get_ascii_payload(),
+                (";:" + ";:".join(commands)).encode("ascii"),
+                dev.device.write_termination.encode("ascii"),
+            ])
+            dev.write_raw(message, echo=echo)
 
 
 if __name__ == "__main__":
@@ -63,7 +122,7 @@ if __name__ == "__main__":
 
     # data += np.random.choice((1, -1), data.shape) * np.random.random(data.shape)
     waveform = Waveform(data, 100e3)
-    for point in waveform.data:
+    for point in waveform.data.tolist():
         print(point)
 
     with FunctionGenerator("USB0::2391::9991::MY52303330::0::INSTR") as dev:
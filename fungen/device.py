@@ -1,3 +1,4 @@
+import functools
 import logging
 from pyvisa import ResourceManager
 
@@ -21,8 +22,11 @@ def check_output(output):
 
 def check(func):
     """Decorator to check that a command executed properly."""
+    _check_output = check_output
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        return check_output(func(*args, **kwargs))
+        return _check_output(func(*args, **kwargs))
     return wrapper
 
 
@@ -67,6 +71,18 @@ class FunctionGenerator(object):
         if self.close_on_exit:
             self.rm.close()
 
+    @property
+    def channel(self):
+        """Property to get or set the output channel commands are sent to."""
+        return self._channel
+
+    @channel.setter
+    def channel(self, value):
+        self._channel = value
+        # Command prefixes are cached since they only change with the channel
+        self._source = f"SOURCE{value}"
+        self._output = f"OUTPUT{value}"
+
     @property
     def id(self):
         """Property that queries the device for and returns its ID string."""
@@ -80,16 +96,43 @@ class FunctionGenerator(object):
     @output.setter
     def output(self, value):
         on_or_off = "ON" if value else "OFF"
-        self.device.write("OUTPUT%s %s" %(self.channel, on_or_off))
+        self.device.write(f"{self._output} {on_or_off}")
 
-    def write(self, command, echo=True):
-        """Wraps the VISA write command."""
+    def write(self, command, echo=False):
+        """Wraps the VISA write command.
+
+        Commands are logged at debug level. Pass ``echo=True`` to also print
+        them.
+
+        """
+        logger.debug("%s", command)
         if echo:
             print(command)
         return self.device.write(command)
 
-    def ask(self, command, echo=True):
+    def write_many(self, commands, echo=False):
+        """Write several commands in a single VISA transaction.
+
+        :param list commands: Commands to join into one compound command.
+
+        """
+        return self.write(";:".join(commands), echo=echo)
+
+    def write_raw(self, message, echo=False):
+        """Wraps the PyVISA ``write_raw`` method.
+
+        :param bytes message: Pre-encoded message. No write termination is
+            appended.
+
+        """
+        logger.debug("%r", message)
+        if echo:
+            print(message)
+        return self.device.write_raw(message)
+
+    def ask(self, command, echo=False):
         """Wraps the PyVISA ``ask`` method."""
+        logger.debug("%s", command)
         if echo:
             print(command)
         return self.device.ask(command)
@@ -101,7 +144,7 @@ class FunctionGenerator(object):
         :param str function:
 
         """
-        return self.device.write("FUNCtion%s %s" %(self.channel, function))
+        return self.device.write(f"FUNCtion{self.channel} {function}")
 
     @check
     def set_amplitude(self, amplitude, units="VPP"):
@@ -113,8 +156,8 @@ class FunctionGenerator(object):
         """
         if units.upper() not in ("VPP", "VRMS", "DBM"):
             raise InvalidUnitsError(str(units))
-        self.device.write("VOLTAGE:UNIT %s" % units)
-        return self.device.write("VOLTAGE %.3E" % amplitude)
+        self.device.write(f"VOLTAGE:UNIT {units}")
+        return self.device.write(f"VOLTAGE {amplitude:.3E}")
 
     @check
     def set_offset(self, offset, units="VPP"):
@@ -126,8 +169,8 @@ class FunctionGenerator(object):
         """
         if units.upper() not in ("VPP", "VRMS", "DBM"):
             raise InvalidUnitsError(str(units))
-        self.device.write("VOLTAGE:UNIT %s" % units)
-        return self.device.write("VOLTAGE:OFFSET %0.8f")
+        self.device.write(f"VOLTAGE:UNIT {units}")
+        return self.device.write(f"VOLTAGE:OFFSET {offset:.8f}")
 
     @check
     def set_frequency(self, frequency):
@@ -136,7 +179,7 @@ class FunctionGenerator(object):
         :param float frequency:
 
         """
-        return self.device.write("FREQUENCY %.8f" % frequency)
+        return self.device.write(f"FREQUENCY {frequency:.8f}")
 
 
 if __name__ == "__main__":